@@ -1,6 +1,7 @@
 """InstructLab Taxonomy Schema"""
 
 # Standard
+from functools import cache
 from importlib import resources
 
 try:
@@ -17,9 +18,16 @@ def schema_versions() -> list[Traversable]:
     Returns:
         list[Traversable]: A sorted list of schema versions.
     """
+    return list(_schema_versions())
+
+
+@cache
+def _schema_versions() -> tuple[Traversable, ...]:
+    # The installed package resources do not change for the life of
+    # the process, so the directory scan only needs to happen once.
     schema_base = resources.files(__package__)
     versions = sorted(
         (v for v in schema_base.iterdir() if v.name[0] == "v" and v.name[1:].isdigit()),
         key=lambda k: int(k.name[1:]),
     )
-    return versions
+    return tuple(versions)
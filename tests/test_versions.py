@@ -1,48 +1,58 @@
 # SPDX-License-Identifier: Apache-2.0
 
 # Standard
+import itertools
 import json
+from functools import cache
 from importlib import resources
 
 # Third Party
+import pytest
 from referencing import Resource
 from referencing.jsonschema import DRAFT202012
 
 from instructlab.schema import schema_versions
 
+VERSIONS = schema_versions()
+
+
+@cache
+def _load_schema(path):
+    data = path.read_bytes()
+    assert data
+    assert len(data) > 1
+    contents = json.loads(data)
+    assert contents
+    assert len(contents) > 1
+    resource = Resource.from_contents(
+        contents=contents, default_specification=DRAFT202012
+    )
+    assert resource
+    assert resource.contents == contents
+    return resource
+
 
 class TestVersions:
     def test_versions(self):
-        versions = schema_versions()
-        assert versions is not None
-        assert len(versions) > 1
-        for i, v in enumerate(versions):
+        assert VERSIONS is not None
+        assert len(VERSIONS) > 1
+        for i, v in enumerate(VERSIONS):
             assert v.name == f"v{i+1}"
 
-    def _load_schema(self, path):
-        text = path.read_text(encoding="utf-8")
-        assert text
-        assert len(text) > 1
-        contents = json.loads(text)
-        assert contents
-        assert len(contents) > 1
-        resource = Resource.from_contents(
-            contents=contents, default_specification=DRAFT202012
-        )
-        assert resource
-        assert resource.contents == contents
-
-    def test_import_schema_base(self):
-        schema_base = resources.files("instructlab.schema")
-        for i in range(len(schema_versions())):
-            schema_version = schema_base.joinpath(f"v{i+1}")
-            for schema_name in ("compositional_skills", "knowledge", "version"):
-                path = schema_version.joinpath(f"{schema_name}.json")
-                self._load_schema(path)
-
-    def test_import_schema_versions(self):
-        for i in range(len(schema_versions())):
-            schema_version = resources.files(f"instructlab.schema.v{i+1}")
-            for schema_name in ("compositional_skills", "knowledge", "version"):
-                path = schema_version.joinpath(f"{schema_name}.json")
-                self._load_schema(path)
+    @pytest.mark.parametrize(
+        "version,schema_name,via",
+        list(
+            itertools.product(
+                [v.name for v in VERSIONS],
+                ["compositional_skills", "knowledge", "version"],
+                ["base", "direct"],
+            )
+        ),
+    )
+    def test_import_schema(self, version, schema_name, via):
+        if via == "base":
+            schema_version = resources.files("instructlab.schema").joinpath(version)
+        else:
+            schema_version = resources.files(f"instructlab.schema.{version}")
+        path = schema_version.joinpath(f"{schema_name}.json")
+        _load_schema(path)